@@ -8,7 +8,6 @@ from pathlib import Path
 
 from neotree import NtreeError
 from neotree.filter import PatternFilter
-from neotree.formatter.compat import CompatOptions, format_compat
 from neotree.scanner import Entry, ScanOptions, scan
 
 
@@ -152,6 +151,25 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+_PARSER: argparse.ArgumentParser | None = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the shared CLI parser, building it on first use.
+
+    Parser construction registers ~20 argparse actions; callers that
+    invoke the CLI repeatedly (tests, scripts driving ``run_ntree``)
+    reuse a single instance.
+
+    Returns:
+        argparse.ArgumentParser: Cached parser for the ``ntree`` command.
+    """
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+    return _PARSER
+
+
 def run_ntree(argv: list[str] | None = None) -> str:
     """Run ntree with provided CLI args and return formatted output.
 
@@ -168,8 +186,7 @@ def run_ntree(argv: list[str] | None = None) -> str:
     Raises:
         NtreeError: On any user-facing validation or I/O error.
     """
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    args = _get_parser().parse_args(argv)
     return _run_with_args(args)
 
 
@@ -276,9 +293,10 @@ def _format_output(args: argparse.Namespace, root: Path, entries: list[Entry]) -
     if args.csv_mode:
         from neotree.formatter.csv_ import CsvOptions, format_csv
 
+        # files_only is applied at scan time, so directory rows never
+        # reach the formatter and its per-row branch stays cold.
         csv_opts = CsvOptions(
             root_path=root,
-            files_only=args.files_only,
             order=args.order,
         )
         return format_csv(entries, csv_opts)
@@ -294,6 +312,8 @@ def _format_output(args: argparse.Namespace, root: Path, entries: list[Entry]) -
         )
         return format_short(entries, short_opts)
 
+    from neotree.formatter.compat import CompatOptions, format_compat
+
     compat_opts = CompatOptions(
         charset=args.charset,
         dirs_first=args.dirs_first,
@@ -305,17 +325,19 @@ def _format_output(args: argparse.Namespace, root: Path, entries: list[Entry]) -
     return format_compat(entries, compat_opts)
 
 
-def _run_with_args(args: argparse.Namespace) -> str:
-    """Run the core scan/format pipeline for parsed arguments.
+def _build_scan_request(
+    args: argparse.Namespace,
+) -> tuple[Path, ScanOptions, PatternFilter | None]:
+    """Validate arguments and build the scan they describe.
 
     Args:
         args: Parsed CLI namespace.
 
     Returns:
-        str: Rendered output.
+        tuple: Resolved root, scan options, and optional exclude filter.
 
     Raises:
-        NtreeError: On any user-facing validation or I/O error.
+        NtreeError: On any user-facing validation error.
     """
     root = _resolve_root(args.directory)
     patterns = _build_exclude_patterns(args)
@@ -328,22 +350,54 @@ def _run_with_args(args: argparse.Namespace) -> str:
         max_depth=scan_max_depth,
         dirs_only=args.dirs_only,
         all_files=args.all_files,
-        files_only=args.files_only if not args.csv_mode else False,
+        files_only=args.files_only,
         gitignore=args.gitignore,
     )
 
-    entries = scan(root, scan_opts, entry_filter)
+    return root, scan_opts, entry_filter
+
+
+def _scan_for_args(args: argparse.Namespace) -> tuple[Path, list[Entry]]:
+    """Validate arguments and run the scan they describe.
+
+    Args:
+        args: Parsed CLI namespace.
+
+    Returns:
+        tuple[Path, list[Entry]]: Resolved root and scanner output.
+
+    Raises:
+        NtreeError: On any user-facing validation error.
+    """
+    root, scan_opts, entry_filter = _build_scan_request(args)
+    return root, scan(root, scan_opts, entry_filter)
+
+
+def _run_with_args(args: argparse.Namespace) -> str:
+    """Run the core scan/format pipeline for parsed arguments.
+
+    Args:
+        args: Parsed CLI namespace.
+
+    Returns:
+        str: Rendered output.
+
+    Raises:
+        NtreeError: On any user-facing validation or I/O error.
+    """
+    root, entries = _scan_for_args(args)
     output = _format_output(args, root, entries)
 
     if args.md_mode:
-        from neotree.formatter.markdown import MdOptions, format_markdown
+        from neotree.formatter.markdown import MdOptions, markdown_frame
 
         md_opts = MdOptions(
             mode="short" if args.short_mode else "compat",
             root=str(root),
             budget=args.budget,
         )
-        output = format_markdown(output, md_opts)
+        prefix, suffix = markdown_frame(md_opts)
+        output = prefix + output + suffix
 
     return output
 
@@ -354,10 +408,16 @@ def main() -> None:
     Parses args exactly once and writes output to stdout or ``-o`` file.
     Exits with code 1 on user-facing errors.
     """
-    parser = build_parser()
-    args = parser.parse_args()  # single parse
+    args = _get_parser().parse_args()  # single parse
+
+    # CSV to a file streams row by row: the document never exists as one
+    # string, so peak memory stays at a single row for large trees.
+    stream_csv = bool(args.output_file) and args.csv_mode and not args.md_mode
 
     try:
+        if stream_csv:
+            _stream_csv_to_file(args)
+            return
         output = _run_with_args(args)
     except NtreeError as exc:
         sys.stderr.write(f"ntree: {exc}\n")
@@ -373,3 +433,27 @@ def main() -> None:
             sys.exit(1)
     else:
         sys.stdout.write(output + "\n")
+
+
+def _stream_csv_to_file(args: argparse.Namespace) -> None:
+    """Write CSV output to ``-o`` file one row at a time.
+
+    Args:
+        args: Parsed CLI namespace with ``csv_mode`` and ``output_file``.
+
+    Raises:
+        NtreeError: On validation errors from the scan pipeline.
+    """
+    from neotree.formatter.csv_ import CsvOptions, scan_to_csv
+
+    root, scan_opts, entry_filter = _build_scan_request(args)
+    csv_opts = CsvOptions(
+        root_path=root,
+        order=args.order,
+    )
+    try:
+        with open(args.output_file, "w", encoding="utf-8", newline="") as fp:
+            scan_to_csv(root, fp, scan_opts, csv_opts, entry_filter)
+    except OSError as exc:
+        sys.stderr.write(f"ntree: cannot write to '{args.output_file}': {exc}\n")
+        sys.exit(1)
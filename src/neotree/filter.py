@@ -2,15 +2,88 @@
 
 from __future__ import annotations
 
-from fnmatch import fnmatch
+import re
+from fnmatch import translate
+from functools import lru_cache
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+@lru_cache(maxsize=128)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a pattern tuple into one alternation regex.
+
+    Cached so repeated CLI invocations (and tests) with the same
+    patterns skip ``fnmatch.translate`` and ``re.compile`` entirely.
+
+    Args:
+        patterns: Non-empty tuple of fnmatch patterns.
+
+    Returns:
+        re.Pattern[str]: Compiled alternation of all patterns.
+    """
+    return re.compile("|".join(f"(?:{translate(p)})" for p in patterns))
+
+
+@lru_cache(maxsize=128)
+def _partition_patterns(
+    patterns: tuple[str, ...],
+) -> tuple[frozenset[str], tuple[str, ...], re.Pattern[str] | None]:
+    """Split patterns into literal, pure-suffix, and general-glob matchers.
+
+    Most real exclusions are literal names (``node_modules``) or pure
+    extension globs (``*.pyc``); those become a frozenset probe and one
+    ``str.endswith`` tuple check. Only the remaining globs need a regex.
+
+    Args:
+        patterns: Non-empty tuple of fnmatch patterns.
+
+    Returns:
+        tuple: ``(literals, suffixes, glob_regex)`` where ``glob_regex``
+        is ``None`` when every pattern had a fast form.
+    """
+    literals: list[str] = []
+    suffixes: list[str] = []
+    globs: list[str] = []
+    for pattern in patterns:
+        if not _GLOB_CHARS.intersection(pattern):
+            literals.append(pattern)
+        elif (
+            len(pattern) > 1
+            and pattern[0] == "*"
+            and not _GLOB_CHARS.intersection(pattern[1:])
+        ):
+            suffixes.append(pattern[1:])
+        else:
+            globs.append(pattern)
+    # Longest first so overlapping suffixes (".egg-info" vs ".info") are
+    # probed most-specific first, and the tuple is deterministic for any
+    # ordering of the source pattern list.
+    suffixes.sort(key=len, reverse=True)
+    glob_regex = _compile_patterns(tuple(globs)) if globs else None
+    return frozenset(literals), tuple(suffixes), glob_regex
+
+
+def _never_exclude(name: str, is_dir: bool) -> bool:
+    """No-op predicate bound to pattern-less filters."""
+    return False
 
 
 class PatternFilter:
     """Filter entries by fnmatch patterns.
 
-    Implements ``-I PATTERN`` exclusion behavior.
+    Implements ``-I PATTERN`` exclusion behavior. Patterns are
+    partitioned once at construction: literal names go into a set,
+    ``*.ext``-style patterns into a suffix tuple, and only the remaining
+    globs are compiled into a single alternation regex. The common cases
+    are therefore one hash probe or one ``endswith`` call per entry.
+
+    Matching only looks at the entry name, so the scanner may apply this
+    filter before it resolves the entry type (see ``EntryFilter``).
     """
 
+    name_only = True
+
     def __init__(self, patterns: list[str] | None = None) -> None:
         """Initialize pattern filter.
 
@@ -18,6 +91,17 @@ class PatternFilter:
             patterns: Optional fnmatch pattern list.
         """
         self._patterns: list[str] = list(patterns) if patterns else []
+        if self._patterns:
+            self._literals, self._suffixes, self._regex = _partition_patterns(
+                tuple(self._patterns)
+            )
+        else:
+            self._literals = frozenset()
+            self._suffixes = ()
+            self._regex = None
+            # Shadow the method per instance so the empty-filter case is a
+            # plain call returning False, with no regex check per entry.
+            self.should_exclude = _never_exclude  # type: ignore[method-assign]
 
     def should_exclude(self, name: str, is_dir: bool) -> bool:
         """Return whether an entry should be excluded.
@@ -29,4 +113,8 @@ class PatternFilter:
         Returns:
             bool: ``True`` when any configured pattern matches.
         """
-        return any(fnmatch(name, pat) for pat in self._patterns)
+        if name in self._literals:
+            return True
+        if self._suffixes and name.endswith(self._suffixes):
+            return True
+        return self._regex is not None and self._regex.match(name) is not None
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import io
+import os
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
 from typing import Literal
 
 from neotree.scanner import Entry
 
+_NAME_KEY = attrgetter("name")
+
 
 @dataclass(frozen=True, slots=True)
 class Glyphs:
@@ -55,45 +60,66 @@ class CompatOptions:
     order: Literal["asc", "desc"] = "asc"
 
 
-def _group_by_parent(entries: list[Entry]) -> dict[Path, list[Entry]]:
-    """Group entries by parent path preserving insertion order.
+def _parent_runs(entries: list[Entry]) -> dict[Path, tuple[int, int]]:
+    """Map each parent path to its contiguous (start, stop) entry run.
+
+    Scanner output keeps all children of one directory contiguous, so a
+    pair of indices replaces the per-parent list copies a grouping dict
+    would need. Identity compare first: the scanner reuses one Path
+    object per directory.
 
     Args:
         entries: Scanner output entries.
 
     Returns:
-        dict[Path, list[Entry]]: Parent to children mapping.
+        dict[Path, tuple[int, int]]: Parent to half-open index range.
     """
-    groups: dict[Path, list[Entry]] = {}
-    for entry in entries:
-        groups.setdefault(entry.parent_path, []).append(entry)
-    return groups
+    runs: dict[Path, tuple[int, int]] = {}
+    prev_parent: Path | None = None
+    start = 0
+    for i, entry in enumerate(entries):
+        parent = entry.parent_path
+        if parent is not prev_parent and parent != prev_parent:
+            if prev_parent is not None:
+                runs[prev_parent] = (start, i)
+            prev_parent = parent
+            start = i
+    if prev_parent is not None:
+        runs[prev_parent] = (start, len(entries))
+    return runs
 
 
 def _sort_children(
-    children: list[Entry], dirs_first: bool, reverse: bool = False
+    entries: list[Entry],
+    run: tuple[int, int] | None,
+    dirs_first: bool,
+    reverse: bool = False,
 ) -> list[Entry]:
-    """Sort children according to current compat options.
+    """Sort one parent's child run according to current compat options.
 
     Args:
-        children: Child entries under one parent.
+        entries: Full scanner output list.
+        run: (start, stop) index range of the children, or ``None``.
         dirs_first: Whether to sort directories before files.
         reverse: Whether to sort in descending order.
 
     Returns:
         list[Entry]: Sorted child entries.
     """
+    if run is None:
+        return []
+    start, stop = run
+    children = entries[start:stop]
     if dirs_first:
-        dirs = sorted(
-            [e for e in children if e.is_dir], key=lambda e: e.name, reverse=reverse
-        )
+        dirs = sorted([e for e in children if e.is_dir], key=_NAME_KEY, reverse=reverse)
         files = sorted(
             [e for e in children if not e.is_dir],
-            key=lambda e: e.name,
+            key=_NAME_KEY,
             reverse=reverse,
         )
         return dirs + files
-    return sorted(children, key=lambda e: e.name, reverse=reverse)
+    children.sort(key=_NAME_KEY, reverse=reverse)
+    return children
 
 
 def _report_line(dir_count: int, file_count: int) -> str:
@@ -131,15 +157,17 @@ def format_compat(
     if opts.root_path is not None:
         root_display = str(opts.root_path)
 
-    lines: list[str] = [root_display]
-
     if not entries:
+        lines = [root_display]
         if not opts.no_report:
             lines.append("")
             lines.append(_report_line(0, 0))
         return "\n".join(lines)
 
-    groups = _group_by_parent(entries)
+    buf = io.StringIO()
+    buf.write(root_display)
+
+    runs = _parent_runs(entries)
 
     root_parent = entries[0].parent_path
     dir_count = 0
@@ -147,28 +175,41 @@ def format_compat(
 
     reverse = opts.order == "desc"
 
+    # Precompute the root prefix once for --fullpath; every child path is
+    # under root, so stripping the string prefix matches relative_to.
+    full_path_prefix = ""
+    if opts.full_path:
+        root_str = str(opts.root_path or root_parent)
+        full_path_prefix = root_str.rstrip(os.sep) + os.sep
+
     # Iterative DFS using an explicit stack.
-    # Stack items: (entry, prefix, is_last_sibling)
-    # Push children in reverse order so that the first child is popped first.
+    # Stack items: (entry, mask, depth, is_last_sibling). The ancestor
+    # chain is packed into an int bitmask (bit i set = level i was a last
+    # sibling, i.e. indent instead of a vertical rule), so pushing a child
+    # is two int ops instead of a tuple or string allocation.
     root_children = _sort_children(
-        groups.get(root_parent, []), opts.dirs_first, reverse
+        entries, runs.get(root_parent), opts.dirs_first, reverse
     )
-    stack: list[tuple[Entry, str, bool]] = []
+    stack: list[tuple[Entry, int, int, bool]] = []
     for i in range(len(root_children) - 1, -1, -1):
-        stack.append((root_children[i], "", i == len(root_children) - 1))
+        stack.append((root_children[i], 0, 0, i == len(root_children) - 1))
+
+    # Joined prefixes cached per (mask, depth): siblings share one ancestor
+    # chain, so each unique prefix string is built once per subtree rather
+    # than once per emitted line.
+    prefix_cache: dict[tuple[int, int], str] = {}
 
     while stack:
-        child, prefix, is_last = stack.pop()
+        child, mask, depth, is_last = stack.pop()
         connector = glyphs.last_branch if is_last else glyphs.branch
 
         display_name = child.name
         if opts.full_path:
-            try:
-                display_name = str(
-                    child.path.relative_to(opts.root_path or root_parent)
-                )
-            except ValueError:
-                display_name = str(child.path)
+            path_str = str(child.path)
+            if path_str.startswith(full_path_prefix):
+                display_name = path_str[len(full_path_prefix) :]
+            else:
+                display_name = path_str
 
         if child.is_dir:
             display_name += "/"
@@ -176,20 +217,37 @@ def format_compat(
         else:
             file_count += 1
 
-        lines.append(f"{prefix}{connector}{display_name}")
+        prefix_key = (mask, depth)
+        prefix = prefix_cache.get(prefix_key)
+        if prefix is None:
+            prefix = "".join(
+                glyphs.space if (mask >> level) & 1 else glyphs.vertical
+                for level in range(depth)
+            )
+            prefix_cache[prefix_key] = prefix
+
+        buf.write("\n")
+        buf.write(prefix)
+        buf.write(connector)
+        buf.write(display_name)
 
         if child.is_dir:
-            next_prefix = prefix + (glyphs.space if is_last else glyphs.vertical)
+            next_mask = mask | (1 << depth) if is_last else mask
             grandchildren = _sort_children(
-                groups.get(child.path, []), opts.dirs_first, reverse
+                entries, runs.get(child.path), opts.dirs_first, reverse
             )
             for j in range(len(grandchildren) - 1, -1, -1):
                 stack.append(
-                    (grandchildren[j], next_prefix, j == len(grandchildren) - 1)
+                    (
+                        grandchildren[j],
+                        next_mask,
+                        depth + 1,
+                        j == len(grandchildren) - 1,
+                    )
                 )
 
     if not opts.no_report:
-        lines.append("")
-        lines.append(_report_line(dir_count, file_count))
+        buf.write("\n\n")
+        buf.write(_report_line(dir_count, file_count))
 
-    return "\n".join(lines)
+    return buf.getvalue()
@@ -23,12 +23,12 @@ from __future__ import annotations
 
 import csv
 import io
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
-from itertools import groupby
 from pathlib import Path
-from typing import Callable, Literal
+from typing import IO, Callable, Literal
 
-from neotree.scanner import Entry
+from neotree.scanner import Entry, EntryFilter, ScanOptions, iter_scan
 
 
 @dataclass(frozen=True, slots=True)
@@ -82,6 +82,23 @@ DEFAULT_COLUMNS: list[CsvColumn] = [
     CsvColumn(name="depth", extract=_extract_depth),
 ]
 
+# Header for the default column set, joined once at import time.
+_DEFAULT_HEADER = ",".join(col.name for col in DEFAULT_COLUMNS)
+
+
+def _csv_field(value: str) -> str:
+    """Quote a CSV field only when required (QUOTE_MINIMAL semantics).
+
+    Args:
+        value: Raw field text.
+
+    Returns:
+        str: Field escaped exactly as ``csv.writer`` would emit it.
+    """
+    if '"' in value or "," in value or "\n" in value or "\r" in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
 
 @dataclass(frozen=True, slots=True)
 class CsvOptions:
@@ -104,6 +121,120 @@ class CsvOptions:
     order: Literal["asc", "desc"] = "asc"
 
 
+def _ordered_entries(
+    entries: list[Entry] | Iterable[Entry], opts: CsvOptions
+) -> Iterable[Entry]:
+    """Return entries reordered for ``opts.order``.
+
+    For desc order, reverse each parent run in place on a copy.
+    Same-parent entries are always contiguous and already sorted
+    ascending in DFS scan output, so reversal is equivalent to a
+    per-group descending sort without the O(N log N) cost. Identity
+    compare first: the scanner reuses one Path object per directory.
+
+    Args:
+        entries: Scanner entries in DFS order.
+        opts: Rendering options.
+
+    Returns:
+        Entries in output order (the input, untouched, for asc).
+    """
+    if opts.order != "desc":
+        return entries
+    effective_entries = list(entries)
+    n = len(effective_entries)
+    i = 0
+    while i < n:
+        parent = effective_entries[i].parent_path
+        j = i + 1
+        while j < n and (
+            effective_entries[j].parent_path is parent
+            or effective_entries[j].parent_path == parent
+        ):
+            j += 1
+        effective_entries[i:j] = effective_entries[i:j][::-1]
+        i = j
+    return effective_entries
+
+
+def format_csv_iter(
+    entries: Iterable[Entry],
+    options: CsvOptions | None = None,
+) -> Iterator[str]:
+    """Yield CSV lines one at a time, header first.
+
+    Streaming counterpart of ``format_csv``: callers writing to a file
+    can drain this generator without ever holding the full document in
+    memory, and ``entries`` may itself be a lazy iterable (such as
+    ``iter_scan`` output) as long as ``root_path`` is set and the order
+    is ascending. Lines carry no trailing newline.
+
+    Args:
+        entries: Scanner entries to render.
+        options: Rendering options.  Defaults to ``CsvOptions()``.
+
+    Yields:
+        str: One CSV line per iteration.
+    """
+    opts = options or CsvOptions()
+    # Inferring the root or reversing per-parent runs needs the whole
+    # list; otherwise entries stream straight through.
+    if opts.root_path is None or opts.order == "desc":
+        entry_list: list[Entry] = list(entries)
+        entries = entry_list
+        root = opts.root_path or (
+            entry_list[0].parent_path if entry_list else Path(".")
+        )
+    else:
+        root = opts.root_path
+    columns = opts.columns
+    effective_entries = _ordered_entries(entries, opts)
+
+    # The default column set is specialized: field reads are inlined (no
+    # CsvColumn.extract dispatch) and each row is one f-string, with
+    # _csv_field keeping quoting identical to csv.writer's QUOTE_MINIMAL
+    # output.
+    if len(columns) == len(DEFAULT_COLUMNS) and all(
+        col is default for col, default in zip(columns, DEFAULT_COLUMNS)
+    ):
+        yield _DEFAULT_HEADER
+        # Siblings share one parent Path, so the name extraction and its
+        # escaping are cached per directory instead of recomputed per row.
+        parent_field_cache: dict[Path, str] = {}
+        for entry in effective_entries:
+            if opts.files_only and entry.is_dir:
+                continue
+            parent = entry.parent_path
+            parent_field = parent_field_cache.get(parent)
+            if parent_field is None:
+                parent_field = _csv_field(parent.name)
+                parent_field_cache[parent] = parent_field
+            yield (
+                f"{parent_field},"
+                f"{_csv_field(entry.name)},"
+                f"{_csv_field(str(entry.path))},"
+                f"{entry.depth}"
+            )
+        return
+
+    # Custom columns: reuse one StringIO per row so csv.writer handles
+    # quoting while each line is still yielded as soon as it is built.
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="")
+    extracts = tuple(col.extract for col in columns)
+
+    writer.writerow([col.name for col in columns])
+    yield buf.getvalue()
+
+    for entry in effective_entries:
+        if opts.files_only and entry.is_dir:
+            continue
+        buf.seek(0)
+        buf.truncate()
+        writer.writerow([extract(entry, root) for extract in extracts])
+        yield buf.getvalue()
+
+
 def format_csv(
     entries: list[Entry],
     options: CsvOptions | None = None,
@@ -129,29 +260,31 @@ def format_csv(
     Returns:
         str: CSV text with header, using LF line endings (no trailing newline).
     """
-    opts = options or CsvOptions()
-    root = opts.root_path or (entries[0].parent_path if entries else Path("."))
-    columns = opts.columns
+    return "\n".join(format_csv_iter(entries, options))
 
-    # For desc order, re-sort within each parent group.
-    # Same-parent entries are always contiguous in DFS scan output.
-    effective_entries: list[Entry]
-    if opts.order == "desc":
-        effective_entries = []
-        for _, grp in groupby(entries, key=lambda e: e.parent_path):
-            effective_entries.extend(sorted(grp, key=lambda e: e.name, reverse=True))
-    else:
-        effective_entries = entries
 
-    buf = io.StringIO()
-    writer = csv.writer(buf, lineterminator="\n")
+def scan_to_csv(
+    root: Path,
+    out: IO[str],
+    scan_options: ScanOptions | None = None,
+    csv_options: CsvOptions | None = None,
+    entry_filter: EntryFilter | None = None,
+) -> None:
+    """Scan a tree and write CSV rows as entries are discovered.
 
-    writer.writerow([col.name for col in columns])
+    Fuses the scan and format passes: each entry goes from ``iter_scan``
+    straight into a written row, so neither the entry list nor the CSV
+    document is ever materialized. Output is newline-terminated,
+    matching what the CLI writes for ``--csv -o``.
 
-    for entry in effective_entries:
-        if opts.files_only and entry.is_dir:
-            continue
-        writer.writerow([col.extract(entry, root) for col in columns])
-
-    # Remove trailing newline that csv.writer appends after the last row
-    return buf.getvalue().rstrip("\n")
+    Args:
+        root: Root directory to scan.
+        out: Writable text stream receiving the CSV lines.
+        scan_options: Scanner options. Defaults to ``ScanOptions()``.
+        csv_options: Rendering options. Defaults to
+            ``CsvOptions(root_path=root)``.
+        entry_filter: Optional exclude filter implementation.
+    """
+    opts = csv_options or CsvOptions(root_path=root)
+    entries = iter_scan(root, scan_options, entry_filter)
+    out.writelines(line + "\n" for line in format_csv_iter(entries, opts))
@@ -21,15 +21,18 @@ class MdOptions:
     budget: int | None = None
 
 
-def format_markdown(content: str, options: MdOptions | None = None) -> str:
-    """Wrap tree content in a Markdown document.
+def markdown_frame(options: MdOptions | None = None) -> tuple[str, str]:
+    """Build the Markdown prefix and suffix framing tree content.
+
+    The frame depends only on the options, so callers holding an
+    already-rendered tree can concatenate ``prefix + content + suffix``
+    directly without handing the full output through another call.
 
     Args:
-        content: Already-rendered tree text.
         options: Markdown wrapping options.
 
     Returns:
-        str: Markdown document with metadata and fenced code block.
+        tuple[str, str]: ``(prefix, suffix)`` strings around the content.
     """
     opts = options or MdOptions()
 
@@ -42,6 +45,18 @@ def format_markdown(content: str, options: MdOptions | None = None) -> str:
 
     header = "## Project structure (generated by ntree)"
     meta = "\n".join(meta_lines)
-    code_block = f"```text\n{content}\n```"
+    return f"{header}\n\n{meta}\n\n```text\n", "\n```"
+
+
+def format_markdown(content: str, options: MdOptions | None = None) -> str:
+    """Wrap tree content in a Markdown document.
+
+    Args:
+        content: Already-rendered tree text.
+        options: Markdown wrapping options.
 
-    return f"{header}\n\n{meta}\n\n{code_block}"
+    Returns:
+        str: Markdown document with metadata and fenced code block.
+    """
+    prefix, suffix = markdown_frame(options)
+    return f"{prefix}{content}{suffix}"
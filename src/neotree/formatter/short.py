@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
@@ -47,7 +46,7 @@ def _build_relative_dir_key(entry_parent: Path, root: Path) -> str:
 def _group_entries_by_parent(
     entries: list[Entry],
     root: Path,
-) -> OrderedDict[str, list[Entry]]:
+) -> dict[str, list[Entry]]:
     """Group entries by parent directory key.
 
     Directories without children are represented as standalone keys ending
@@ -58,28 +57,32 @@ def _group_entries_by_parent(
         root: Root path used for relative directory keys.
 
     Returns:
-        OrderedDict[str, list[Entry]]: Grouped entries by display directory key.
+        dict[str, list[Entry]]: Grouped entries by display directory key.
     """
-    groups: OrderedDict[str, list[Entry]] = OrderedDict()
-    dir_paths_with_children: set[str] = set()
+    groups: dict[str, list[Entry]] = {}
 
-    # First pass: record which directories have children
-    for entry in entries:
-        parent_rel = _build_relative_dir_key(entry.parent_path, root)
-        dir_paths_with_children.add(parent_rel)
+    # Single pass: each directory gets a tentative childless "key/" line
+    # when first seen; it is dropped as soon as any child of that directory
+    # shows up. Relative keys are cached per parent Path so each unique
+    # directory is converted exactly once.
+    key_cache: dict[Path, str] = {}
+
+    def key_of(path: Path) -> str:
+        key = key_cache.get(path)
+        if key is None:
+            key = _build_relative_dir_key(path, root)
+            key_cache[path] = key
+        return key
 
     for entry in entries:
-        parent_key = _build_relative_dir_key(entry.parent_path, root)
+        parent_key = key_of(entry.parent_path)
+
+        # Parent has at least this child: it is not childless.
+        groups.pop(parent_key + "/", None)
 
         if entry.is_dir:
-            # Check if this dir has children (appears as a parent_key)
-            try:
-                dir_rel = str(entry.path.relative_to(root)).replace("\\", "/")
-            except ValueError:
-                dir_rel = str(entry.path)
-            if dir_rel not in dir_paths_with_children:
-                # Childless dir: standalone line
-                groups.setdefault(dir_rel + "/", [])
+            # Tentatively childless until a child appears later in the scan.
+            groups.setdefault(key_of(entry.path) + "/", [])
             # Don't add the dir itself as a file entry
             continue
 
@@ -118,7 +121,7 @@ def _format_group_line(
 
 
 def _aggregate_deep_groups(
-    groups: OrderedDict[str, list[Entry]],
+    groups: dict[str, list[Entry]],
     budget: int,
     count: bool,
 ) -> list[str]:
@@ -132,47 +135,37 @@ def _aggregate_deep_groups(
     Returns:
         list[str]: Final formatted lines after required aggregation.
     """
-    overrides: dict[str, str] = {}
-
-    def _build_lines() -> list[str]:
-        result = []
-        for k, v in groups.items():
-            if k in overrides:
-                result.append(overrides[k])
-            else:
-                result.append(_format_group_line(k, v, count))
-        return result
-
-    def _lines_length(lines: list[str]) -> int:
-        return sum(len(line) for line in lines) + len(lines)
-
-    lines = _build_lines()
-    total = _lines_length(lines)
+    lines = [_format_group_line(k, v, count) for k, v in groups.items()]
+    # Total output length counts one newline (or final terminator) per line.
+    total = sum(len(line) for line in lines) + len(lines)
 
     if total <= budget:
         return lines
 
-    # Sort group keys by depth (deepest first) for aggregation candidates
-    sorted_keys = sorted(
-        groups.keys(),
-        key=lambda k: k.count("/"),
-        reverse=True,
-    )
+    key_to_index = {k: i for i, k in enumerate(groups)}
+
+    # Sort group keys by depth (deepest first) for aggregation candidates.
+    # Depths are computed once up front rather than per comparison.
+    depths = {k: k.count("/") for k in groups}
+    sorted_keys = sorted(groups.keys(), key=depths.__getitem__, reverse=True)
 
     for key in sorted_keys:
-        lines = _build_lines()
-        if _lines_length(lines) <= budget:
+        if total <= budget:
             break
 
-        # Skip already-aggregated or childless (empty) groups
-        if key in overrides or not groups[key]:
+        # Skip childless (empty) groups
+        if not groups[key]:
             continue
 
         n_files = len(groups[key])
         clean_key = key.rstrip("/")
-        overrides[key] = f"{clean_key}/* ({n_files} files)"
+        new_line = f"{clean_key}/* ({n_files} files)"
+
+        idx = key_to_index[key]
+        total += len(new_line) - len(lines[idx])
+        lines[idx] = new_line
 
-    return _build_lines()
+    return lines
 
 
 def format_short(
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import os
+import re
 from pathlib import Path
 
 from pathspec import GitIgnoreSpec
@@ -10,9 +12,82 @@ from pathspec import GitIgnoreSpec
 logger = logging.getLogger(__name__)
 
 
-def load_gitignore_spec(root: Path) -> GitIgnoreSpec | None:
+class CompiledGitIgnore:
+    """Single-regex matcher for negation-free gitignore files.
+
+    pathspec checks every pattern per path; without ``!`` negations the
+    answer is simply "does any pattern match", so the per-pattern
+    regexes pathspec already compiled can be unioned into one
+    alternation and each lookup becomes a single C-level match.
+    """
+
+    __slots__ = ("_match",)
+
+    def __init__(self, regex: re.Pattern[str]) -> None:
+        """Initialize from a combined pattern regex.
+
+        Args:
+            regex: Alternation of the spec's per-pattern regexes.
+        """
+        self._match = regex.match
+
+    def match_file(self, path: str) -> bool:
+        """Return whether a root-relative posix path is ignored.
+
+        Args:
+            path: Path relative to the scan root, ``/``-separated, with
+                a trailing ``/`` for directories.
+
+        Returns:
+            bool: ``True`` when any gitignore pattern matches.
+        """
+        return self._match(path) is not None
+
+
+GitIgnoreMatcher = GitIgnoreSpec | CompiledGitIgnore
+
+
+def _compile_spec(spec: GitIgnoreSpec) -> GitIgnoreMatcher:
+    """Collapse a spec into one union regex when semantics allow.
+
+    Args:
+        spec: Compiled pathspec spec.
+
+    Returns:
+        A ``CompiledGitIgnore`` for negation-free specs, otherwise the
+        spec itself (negations need pathspec's last-match-wins logic).
+    """
+    patterns = list(spec.patterns)
+    regexes = [p.regex for p in patterns if p.include and p.regex is not None]
+    if not regexes or len(regexes) != len(patterns):
+        return spec
+    # pathspec anchors each regex at the start, so any-match over the
+    # union equals any-match over the individual patterns. The named
+    # dir-marker group must be de-named to appear more than once.
+    parts = (r.pattern.replace("(?P<ps_d>", "(?:") for r in regexes)
+    try:
+        return CompiledGitIgnore(re.compile("|".join(f"(?:{p})" for p in parts)))
+    except re.error:
+        # The de-naming targets a pathspec-internal group name; if a
+        # future pathspec release renames it, the union would redefine a
+        # named group. Degrade to pathspec matching instead of crashing.
+        return spec
+
+
+# Compiled specs keyed by (path, mtime_ns, size) so repeated loads of an
+# unchanged .gitignore skip both the file read and pattern compilation.
+# Bounded so long-lived processes that edit .gitignore (each edit mints a
+# new key) cannot grow the cache without limit.
+_SPEC_CACHE: dict[tuple[str, int, int], GitIgnoreMatcher] = {}
+_SPEC_CACHE_MAX = 4096
+
+
+def load_gitignore_spec(root: Path) -> GitIgnoreMatcher | None:
     """Load .gitignore patterns from *root* directory.
 
+    Results are cached per file identity (path, mtime, size), so calling
+    this repeatedly for the same unchanged root is a dict lookup.
+
     Args:
         root: Directory containing the ``.gitignore`` file.
 
@@ -22,8 +97,25 @@ def load_gitignore_spec(root: Path) -> GitIgnoreSpec | None:
     """
     gitignore_path = root / ".gitignore"
     try:
-        lines = gitignore_path.read_text(encoding="utf-8").splitlines()
+        stat = os.stat(gitignore_path)
+        cache_key = (str(gitignore_path), stat.st_mtime_ns, stat.st_size)
+        cached = _SPEC_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        with open(gitignore_path, "rb") as fp:
+            raw = fp.read()
     except OSError:
         logger.debug("Cannot read .gitignore: %s", gitignore_path)
         return None
-    return GitIgnoreSpec.from_lines(lines)
+    text = raw.decode("utf-8", errors="replace")
+    if "\r" in text:
+        # Preserve read_text's universal-newline behavior for CRLF files.
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    # str.split avoids splitlines' scan for every Unicode line separator;
+    # pathspec ignores the blank tail line from a trailing newline.
+    spec = _compile_spec(GitIgnoreSpec.from_lines(text.split("\n")))
+    if len(_SPEC_CACHE) >= _SPEC_CACHE_MAX:
+        # Evict oldest insertion; stale keys from edited files go first.
+        _SPEC_CACHE.pop(next(iter(_SPEC_CACHE)))
+    _SPEC_CACHE[cache_key] = spec
+    return spec
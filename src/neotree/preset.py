@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from typing import Final
 
 PRESETS: Final[dict[str, list[str]]] = {
@@ -35,17 +36,15 @@ PRESETS: Final[dict[str, list[str]]] = {
 _ALWAYS_APPLIED: Final[list[str]] = ["generic"]
 
 
-def get_preset_patterns(name: str) -> list[str]:
-    """Return exclusion patterns for a named preset.
-
-    The ``generic`` preset is always included in addition to the
-    requested preset.
+@cache
+def _combined_patterns(name: str) -> tuple[str, ...]:
+    """Combine a preset with the always-applied ones, memoized per name.
 
     Args:
         name: Preset name.
 
     Returns:
-        list[str]: Combined exclusion pattern list.
+        tuple[str, ...]: Combined exclusion patterns.
 
     Raises:
         ValueError: If ``name`` is not a known preset.
@@ -59,4 +58,23 @@ def get_preset_patterns(name: str) -> list[str]:
         if always != name:
             patterns.extend(PRESETS[always])
     patterns.extend(PRESETS[name])
-    return patterns
+    return tuple(patterns)
+
+
+def get_preset_patterns(name: str) -> list[str]:
+    """Return exclusion patterns for a named preset.
+
+    The ``generic`` preset is always included in addition to the
+    requested preset. The combination is built once per preset name;
+    callers get a fresh list they are free to mutate.
+
+    Args:
+        name: Preset name.
+
+    Returns:
+        list[str]: Combined exclusion pattern list.
+
+    Raises:
+        ValueError: If ``name`` is not a known preset.
+    """
+    return list(_combined_patterns(name))
@@ -4,20 +4,34 @@ from __future__ import annotations
 
 import logging
 import os
+import sys
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, NamedTuple, Protocol
 
 if TYPE_CHECKING:
-    from pathspec import GitIgnoreSpec
+    from neotree.gitignore import GitIgnoreMatcher
 
 logger = logging.getLogger(__name__)
 
+# Parallel listing only pays off when the root fans out; small trees keep
+# the serial walk.
+_PARALLEL_THRESHOLD = 4
 
-@dataclass(frozen=True, slots=True)
-class Entry:
+_ENTRY_NAME_KEY = attrgetter("name")
+
+
+class Entry(NamedTuple):
     """A single filesystem entry discovered during scanning.
 
+    A NamedTuple rather than a frozen dataclass: one Entry is allocated
+    per filesystem entry, and the single C-level tuple allocation avoids
+    the per-field ``object.__setattr__`` a frozen ``__init__`` performs.
+    Attribute access and construction syntax are unchanged.
+
     Attributes:
         path: Absolute path of the filesystem entry.
         name: Basename of the entry.
@@ -44,6 +58,9 @@ class ScanOptions:
         files_only: Whether to include only files (directories are traversed
             but not added to results). Mutually exclusive with ``dirs_only``.
         gitignore: Whether to apply root ``.gitignore`` rules.
+        limit: Maximum number of entries to return. ``None`` means
+            unlimited. The walk stops as soon as the limit is reached,
+            so bounded queries cost O(output) rather than O(tree).
     """
 
     max_depth: int | None = None
@@ -51,24 +68,23 @@ class ScanOptions:
     all_files: bool = False
     files_only: bool = False
     gitignore: bool = False
+    limit: int | None = None
 
 
 class EntryFilter(Protocol):
     """Protocol for entry filtering.
 
     Keeps scanner logic decoupled from matching strategy.
+
+    Implementations that never look at ``is_dir`` may set a ``name_only``
+    attribute to ``True``; the scanner then runs them before the type
+    lookup, which skips a stat on filesystems without dirent types for
+    entries that get excluded anyway.
     """
 
     def should_exclude(self, name: str, is_dir: bool) -> bool: ...
 
 
-class _NullFilter:
-    """Default pass-through filter that excludes nothing."""
-
-    def should_exclude(self, name: str, is_dir: bool) -> bool:
-        return False
-
-
 def scan(
     root: Path,
     options: ScanOptions | None = None,
@@ -84,26 +100,74 @@ def scan(
     Returns:
         list[Entry]: Flat list of discovered entries.
     """
+    return list(iter_scan(root, options, entry_filter))
+
+
+def iter_scan(
+    root: Path,
+    options: ScanOptions | None = None,
+    entry_filter: EntryFilter | None = None,
+) -> Iterator[Entry]:
+    """Yield entries lazily in the same DFS order ``scan`` returns.
+
+    The serial walk visits directories in output order, so entries
+    stream out as each directory is listed and the working set stays at
+    one directory's worth. The parallel path lists out of order and
+    therefore buffers before yielding; callers that only consume a
+    prefix still avoid the full-list copy.
+
+    Args:
+        root: Root directory to scan.
+        options: Scanner options. Defaults to ``ScanOptions()``.
+        entry_filter: Optional exclude filter implementation.
+
+    Yields:
+        Entry: Discovered entries in deterministic DFS order.
+    """
     scan_options = options or ScanOptions()
-    active_filter = entry_filter or _NullFilter()
     root = root.resolve()
 
     if not root.is_dir():
-        return []
+        return
 
-    gitignore_spec: GitIgnoreSpec | None = None
+    gitignore_spec: GitIgnoreMatcher | None = None
     if scan_options.gitignore:
         from neotree.gitignore import load_gitignore_spec
 
         gitignore_spec = load_gitignore_spec(root)
 
-    result: list[Entry] = []
+    # List the root serially; its fan-out decides whether the parallel
+    # listing phase is worth the thread-pool overhead.
+    root_entries, root_children = _list_dir(
+        root, 0, root, scan_options, entry_filter, gitignore_spec
+    )
+
+    remaining = scan_options.limit
+
+    # A limit favors the streaming serial walk: the early exit below
+    # stops listing directories entirely, while the parallel path would
+    # walk the whole tree before the cap applied.
+    if remaining is None and len(root_children) > _PARALLEL_THRESHOLD:
+        listing = _list_tree_parallel(
+            root,
+            root_entries,
+            root_children,
+            scan_options,
+            entry_filter,
+            gitignore_spec,
+        )
+        yield from _assemble_dfs(root, listing)
+        return
+
+    if remaining is not None and len(root_entries) >= remaining:
+        yield from root_entries[:remaining]
+        return
+    yield from root_entries
+    if remaining is not None:
+        remaining -= len(root_entries)
 
     # Stack items: (directory_path, depth)
-    # We push directories in reversed sorted order so that
-    # the first entry (alphabetically) is popped first.
-    stack: list[tuple[Path, int]] = [(root, 0)]
-
+    stack: list[tuple[Path, int]] = list(reversed(root_children))
     while stack:
         current_dir, depth = stack.pop()
 
@@ -111,61 +175,220 @@ def scan(
         if scan_options.max_depth is not None and depth > scan_options.max_depth:
             continue
 
-        try:
-            raw_entries = list(os.scandir(current_dir))
-        except PermissionError:
-            logger.debug("Permission denied: %s", current_dir)
+        entries, child_dirs = _list_dir(
+            current_dir,
+            depth,
+            root,
+            scan_options,
+            entry_filter,
+            gitignore_spec,
+        )
+        if remaining is not None and len(entries) >= remaining:
+            yield from entries[:remaining]
+            return
+        yield from entries
+        if remaining is not None:
+            remaining -= len(entries)
+
+        # Push children in reverse so first-alphabetical is popped
+        # first; one extend of a reversed slice instead of a Python
+        # append loop.
+        stack.extend(child_dirs[::-1])
+
+
+def _list_dir(
+    current_dir: Path,
+    depth: int,
+    root: Path,
+    scan_options: ScanOptions,
+    active_filter: EntryFilter | None,
+    gitignore_spec: GitIgnoreMatcher | None,
+) -> tuple[list[Entry], list[tuple[Path, int]]]:
+    """List one directory, applying all configured filters.
+
+    Args:
+        current_dir: Directory to list.
+        depth: Parent depth of entries in this directory.
+        root: Scan root for gitignore-relative paths.
+        scan_options: Scanner options.
+        active_filter: Exclude filter implementation, or ``None``.
+        gitignore_spec: Optional compiled gitignore spec.
+
+    Returns:
+        tuple: ``(entries, child_dirs)`` where ``child_dirs`` holds
+        ``(path, depth + 1)`` pairs for directories to descend into.
+    """
+    # Context-managed scandir closes the OS directory handle as soon as
+    # listing finishes instead of waiting for GC. Hidden entries are
+    # dropped while draining the iterator (unless -a) so the sort only
+    # sees survivors.
+    try:
+        with os.scandir(current_dir) as scandir_it:
+            if scan_options.all_files:
+                raw_entries = list(scandir_it)
+            else:
+                raw_entries = [e for e in scandir_it if not e.name.startswith(".")]
+    except PermissionError:
+        logger.debug("Permission denied: %s", current_dir)
+        return [], []
+
+    # Sort entries by name for deterministic output. attrgetter runs the
+    # key extraction in C, skipping a lambda frame per entry.
+    raw_entries.sort(key=_ENTRY_NAME_KEY)
+
+    entries: list[Entry] = []
+    child_dirs: list[tuple[Path, int]] = []
+    # Bound-method locals: skips the attribute lookup per appended entry.
+    entries_append = entries.append
+    child_dirs_append = child_dirs.append
+
+    # Resolve the filter once per directory instead of per entry: the
+    # default no-filter scan then performs zero filter calls, and name-only
+    # filters run before the type lookup below, which can cost a stat when
+    # the filesystem reports DT_UNKNOWN.
+    pre_exclude = post_exclude = None
+    if active_filter is not None:
+        if getattr(active_filter, "name_only", False):
+            pre_exclude = active_filter.should_exclude
+        else:
+            post_exclude = active_filter.should_exclude
+
+    for dir_entry in raw_entries:
+        # Interned: basenames repeat heavily across directories
+        # (__init__.py, README.md), so duplicates collapse to one string
+        # object instead of one allocation per occurrence.
+        name = sys.intern(dir_entry.name)
+
+        if pre_exclude is not None and pre_exclude(name, False):
             continue
 
-        # Sort entries by name for deterministic output
-        raw_entries.sort(key=lambda e: e.name)
+        try:
+            is_dir = dir_entry.is_dir(follow_symlinks=False)
+        except OSError:
+            logger.debug("Cannot stat: %s", dir_entry.path)
+            continue
 
-        child_dirs: list[tuple[Path, int]] = []
+        if post_exclude is not None and post_exclude(name, is_dir):
+            continue
 
-        for dir_entry in raw_entries:
-            name = dir_entry.name
-            try:
-                is_dir = dir_entry.is_dir(follow_symlinks=False)
-            except OSError:
-                logger.debug("Cannot stat: %s", dir_entry.path)
+        if gitignore_spec is not None:
+            rel_path = Path(dir_entry.path).relative_to(root).as_posix()
+            if is_dir:
+                rel_path += "/"
+            if gitignore_spec.match_file(rel_path):
                 continue
 
-            # Hidden file filtering (unless -a)
-            if not scan_options.all_files and name.startswith("."):
-                continue
+        if scan_options.dirs_only and not is_dir:
+            continue
 
-            if active_filter.should_exclude(name, is_dir):
-                continue
+        # One Path per entry: the same object serves the Entry and the
+        # descent stack, halving Path parsing for directories.
+        entry_path = Path(dir_entry.path)
 
-            if gitignore_spec is not None:
-                rel_path = Path(dir_entry.path).relative_to(root).as_posix()
-                if is_dir:
-                    rel_path += "/"
-                if gitignore_spec.match_file(rel_path):
-                    continue
+        # files_only: traverse into dirs but exclude them from results
+        if scan_options.files_only and is_dir:
+            child_dirs_append((entry_path, depth + 1))
+            continue
 
-            if scan_options.dirs_only and not is_dir:
-                continue
+        entry = Entry(
+            path=entry_path,
+            name=name,
+            is_dir=is_dir,
+            depth=depth,
+            parent_path=current_dir,
+        )
+        entries_append(entry)
 
-            # files_only: traverse into dirs but exclude them from results
-            if scan_options.files_only and is_dir:
-                child_dirs.append((Path(dir_entry.path), depth + 1))
-                continue
+        if is_dir:
+            child_dirs_append((entry_path, depth + 1))
 
-            entry = Entry(
-                path=Path(dir_entry.path),
-                name=name,
-                is_dir=is_dir,
-                depth=depth,
-                parent_path=current_dir,
-            )
-            result.append(entry)
+    return entries, child_dirs
 
-            if is_dir:
-                child_dirs.append((Path(dir_entry.path), depth + 1))
 
-        # Push children in reverse so first-alphabetical is popped first
-        for child in reversed(child_dirs):
+def _list_tree_parallel(
+    root: Path,
+    root_entries: list[Entry],
+    root_children: list[tuple[Path, int]],
+    scan_options: ScanOptions,
+    active_filter: EntryFilter | None,
+    gitignore_spec: GitIgnoreMatcher | None,
+) -> dict[Path, tuple[list[Entry], list[tuple[Path, int]]]]:
+    """List all directories below root on a thread pool.
+
+    os.scandir and DirEntry.is_dir release the GIL, so wide trees
+    overlap their directory I/O. Each worker lists exactly one
+    directory; ordering is restored later by ``_assemble_dfs``, so the
+    result is identical to the serial walk.
+
+    Args:
+        root: Resolved scan root.
+        root_entries: Entries already listed for the root itself.
+        root_children: Root's child directories with depths.
+        scan_options: Scanner options.
+        active_filter: Exclude filter implementation, or ``None``.
+        gitignore_spec: Optional compiled gitignore spec.
+
+    Returns:
+        dict: Per-directory ``(entries, child_dirs)`` listing.
+    """
+    listing = {root: (root_entries, root_children)}
+    max_depth = scan_options.max_depth
+
+    with ThreadPoolExecutor() as pool:
+        pending: dict[Future[tuple[list[Entry], list[tuple[Path, int]]]], Path] = {}
+
+        def submit_children(children: list[tuple[Path, int]]) -> None:
+            for child, depth in children:
+                if max_depth is not None and depth > max_depth:
+                    continue
+                future = pool.submit(
+                    _list_dir,
+                    child,
+                    depth,
+                    root,
+                    scan_options,
+                    active_filter,
+                    gitignore_spec,
+                )
+                pending[future] = child
+
+        submit_children(root_children)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                current_dir = pending.pop(future)
+                entries, child_dirs = future.result()
+                listing[current_dir] = (entries, child_dirs)
+                submit_children(child_dirs)
+
+    return listing
+
+
+def _assemble_dfs(
+    root: Path,
+    listing: dict[Path, tuple[list[Entry], list[tuple[Path, int]]]],
+) -> list[Entry]:
+    """Flatten per-directory listings into deterministic DFS order.
+
+    Args:
+        root: Resolved scan root.
+        listing: Per-directory ``(entries, child_dirs)`` results.
+
+    Returns:
+        list[Entry]: Entries in the same order the serial walk produces.
+    """
+    result: list[Entry] = []
+    stack: list[Path] = [root]
+
+    while stack:
+        current = stack.pop()
+        found = listing.get(current)
+        if found is None:
+            continue
+        entries, child_dirs = found
+        result.extend(entries)
+        for child, _ in child_dirs[::-1]:
             stack.append(child)
 
     return result
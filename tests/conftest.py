@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
+from neotree.scanner import Entry, ScanOptions, scan
 
-@pytest.fixture
-def sample_tree(tmp_path: Path) -> Path:
-    """Create a standard test directory tree.
+
+def _populate_sample_tree(tmp_path: Path) -> Path:
+    """Create the standard test directory tree under ``tmp_path``.
 
     Structure::
 
@@ -42,8 +44,32 @@ def sample_tree(tmp_path: Path) -> Path:
 
 
 @pytest.fixture
-def noisy_tree(tmp_path: Path) -> Path:
-    """Tree with noise directories (node_modules, __pycache__, etc.).
+def sample_tree(tmp_path: Path) -> Path:
+    """Per-test standard tree; safe for tests that mutate it."""
+    return _populate_sample_tree(tmp_path)
+
+
+@pytest.fixture(scope="session")
+def sample_tree_ro(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-scoped standard tree for read-only tests."""
+    return _populate_sample_tree(tmp_path_factory.mktemp("sample_tree"))
+
+
+@pytest.fixture(scope="session")
+def sample_tree_with_env(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-scoped standard tree plus a hidden ``.env`` file.
+
+    The ``-a`` tests only need one extra hidden file; building it into
+    a shared tree avoids rebuilding the whole sample tree per test just
+    to add it.
+    """
+    root = _populate_sample_tree(tmp_path_factory.mktemp("sample_tree_env"))
+    (root / ".env").write_text("secret")
+    return root
+
+
+def _populate_noisy_tree(tmp_path: Path) -> Path:
+    """Create the noisy tree (node_modules, __pycache__, etc.).
 
     Structure::
 
@@ -72,6 +98,18 @@ def noisy_tree(tmp_path: Path) -> Path:
     return tmp_path
 
 
+@pytest.fixture
+def noisy_tree(tmp_path: Path) -> Path:
+    """Per-test noisy tree; safe for tests that mutate it."""
+    return _populate_noisy_tree(tmp_path)
+
+
+@pytest.fixture(scope="session")
+def noisy_tree_ro(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-scoped noisy tree for read-only tests."""
+    return _populate_noisy_tree(tmp_path_factory.mktemp("noisy_tree"))
+
+
 @pytest.fixture
 def gitignore_tree(tmp_path: Path) -> Path:
     """Tree with .gitignore for gitignore-integration testing.
@@ -102,6 +140,40 @@ def gitignore_tree(tmp_path: Path) -> Path:
     return tmp_path
 
 
+class NameFilter:
+    """Minimal EntryFilter excluding exactly one name, for scanner tests."""
+
+    __slots__ = ("name",)
+    name_only = True
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def should_exclude(self, name: str, is_dir: bool) -> bool:
+        return name == self.name
+
+
+@pytest.fixture(scope="session")
+def scan_cache() -> Callable[..., list[Entry]]:
+    """Session-scoped memoized scan for read-only fixture trees.
+
+    Tests that repeatedly scan the same shared tree with identical
+    options hit a dict instead of re-walking the filesystem. Only safe
+    for trees that are not mutated after creation; callers must not
+    mutate the returned list.
+    """
+    cache: dict[tuple[Path, ScanOptions | None], list[Entry]] = {}
+
+    def cached_scan(root: Path, options: ScanOptions | None = None) -> list[Entry]:
+        key = (root, options)
+        entries = cache.get(key)
+        if entries is None:
+            entries = cache[key] = scan(root, options)
+        return entries
+
+    return cached_scan
+
+
 GOLDEN_DIR = Path(__file__).parent / "golden"
 
 
@@ -127,8 +199,11 @@ def assert_golden(output: str, name: str) -> None:
             )
         return
 
-    expected = golden_file.read_text(encoding="utf-8")
-    assert output == expected, (
+    # Compare as bytes: skips decoding the golden file just to throw the
+    # string away on the (normal) matching path. Decode happens only in
+    # pytest's diff rendering on failure.
+    expected = golden_file.read_bytes()
+    assert output.encode("utf-8") == expected, (
         f"Output differs from golden file '{golden_file.name}'.\n"
         f"Run with UPDATE_GOLDEN=true to regenerate."
     )
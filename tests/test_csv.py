@@ -1,5 +1,6 @@
 """Tests for CSV formatter and files-only scan option."""
 
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -7,7 +8,7 @@ import pytest
 from neotree import NtreeError
 from neotree.cli import run_ntree
 from neotree.formatter.csv_ import CsvOptions, format_csv
-from neotree.scanner import ScanOptions, scan
+from neotree.scanner import Entry, ScanOptions, scan
 
 
 def _build_csv_tree(tmp_path: Path) -> Path:
@@ -30,6 +31,41 @@ def _build_csv_tree(tmp_path: Path) -> Path:
     return tmp_path
 
 
+@pytest.fixture(scope="session")
+def csv_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-scoped CSV tree shared by the read-only formatter tests.
+
+    Built once per session so the format_csv test classes can reuse one
+    cached scan instead of rebuilding and re-walking per test.
+    """
+    return _build_csv_tree(tmp_path_factory.mktemp("csv_tree"))
+
+
+@pytest.fixture(scope="session")
+def csv_default_output(
+    scan_cache: Callable[..., list[Entry]], csv_tree: Path
+) -> tuple[int, str, list[str]]:
+    """Default-options CSV pipeline result, computed once per session.
+
+    Returns:
+        tuple: ``(entry_count, output, lines)`` where ``lines`` is the
+        split output including the header line.
+    """
+    entries = scan_cache(csv_tree)
+    output = format_csv(entries, CsvOptions(root_path=csv_tree))
+    return len(entries), output, output.splitlines()
+
+
+@pytest.fixture(scope="session")
+def csv_files_only_output(
+    scan_cache: Callable[..., list[Entry]], csv_tree: Path
+) -> list[str]:
+    """files_only CSV data rows (header dropped), computed once per session."""
+    entries = scan_cache(csv_tree)
+    output = format_csv(entries, CsvOptions(root_path=csv_tree, files_only=True))
+    return output.splitlines()[1:]
+
+
 def _csv_output(root: Path, cli_args: list[str]) -> str:
     return run_ntree([str(root), *cli_args])
 
@@ -47,26 +83,25 @@ class TestCsvOptions:
 
 
 class TestFormatCsvSchema:
-    def test_header_row_present(self, tmp_path: Path) -> None:
-        root = _build_csv_tree(tmp_path)
-        entries = scan(root)
-        output = format_csv(entries, CsvOptions(root_path=root))
-        first_line = output.splitlines()[0]
-        assert first_line == "parent_dir,filename,fullpath,depth"
+    def test_header_row_present(
+        self, csv_default_output: tuple[int, str, list[str]]
+    ) -> None:
+        _, _, lines = csv_default_output
+        assert lines[0] == "parent_dir,filename,fullpath,depth"
 
-    def test_each_row_has_four_columns(self, tmp_path: Path) -> None:
-        root = _build_csv_tree(tmp_path)
-        entries = scan(root)
-        output = format_csv(entries, CsvOptions(root_path=root))
-        for line in output.splitlines()[1:]:
+    def test_each_row_has_four_columns(
+        self, csv_default_output: tuple[int, str, list[str]]
+    ) -> None:
+        _, _, lines = csv_default_output
+        for line in lines[1:]:
             assert line.count(",") >= 3, f"Row has fewer than 4 columns: {line!r}"
 
-    def test_entry_count_matches_rows(self, tmp_path: Path) -> None:
-        root = _build_csv_tree(tmp_path)
-        entries = scan(root)
-        output = format_csv(entries, CsvOptions(root_path=root))
+    def test_entry_count_matches_rows(
+        self, csv_default_output: tuple[int, str, list[str]]
+    ) -> None:
+        entry_count, _, lines = csv_default_output
         # header + one row per entry
-        assert len(output.splitlines()) == len(entries) + 1
+        assert len(lines) == entry_count + 1
 
     def test_empty_entries_returns_header_only(self, tmp_path: Path) -> None:
         output = format_csv([], CsvOptions(root_path=tmp_path))
@@ -74,72 +109,62 @@ class TestFormatCsvSchema:
 
 
 class TestFormatCsvColumns:
-    def test_parent_dir_is_immediate_parent_name(self, tmp_path: Path) -> None:
-        root = _build_csv_tree(tmp_path)
-        entries = scan(root)
-        output = format_csv(entries, CsvOptions(root_path=root))
-        rows = output.splitlines()[1:]
+    def test_parent_dir_is_immediate_parent_name(
+        self, csv_default_output: tuple[int, str, list[str]]
+    ) -> None:
+        _, _, lines = csv_default_output
         # guide.md parent should be "docs"
-        guide_row = next(r for r in rows if "guide.md" in r)
+        guide_row = next(r for r in lines[1:] if "guide.md" in r)
         assert guide_row.startswith("docs,guide.md,")
 
-    def test_root_level_file_parent_dir_is_root_name(self, tmp_path: Path) -> None:
-        root = _build_csv_tree(tmp_path)
-        root_name = root.name
-        entries = scan(root)
-        output = format_csv(entries, CsvOptions(root_path=root))
-        rows = output.splitlines()[1:]
-        readme_row = next(r for r in rows if "README.md" in r)
-        assert readme_row.startswith(f"{root_name},README.md,")
+    def test_root_level_file_parent_dir_is_root_name(
+        self, csv_tree: Path, csv_default_output: tuple[int, str, list[str]]
+    ) -> None:
+        _, _, lines = csv_default_output
+        readme_row = next(r for r in lines[1:] if "README.md" in r)
+        assert readme_row.startswith(f"{csv_tree.name},README.md,")
 
-    def test_fullpath_uses_os_separator(self, tmp_path: Path) -> None:
-        root = _build_csv_tree(tmp_path)
-        entries = scan(root)
-        output = format_csv(entries, CsvOptions(root_path=root))
-        rows = output.splitlines()[1:]
-        app_row = next(r for r in rows if "app.py" in r)
+    def test_fullpath_uses_os_separator(
+        self, csv_tree: Path, csv_default_output: tuple[int, str, list[str]]
+    ) -> None:
+        _, _, lines = csv_default_output
+        app_row = next(r for r in lines[1:] if "app.py" in r)
         # fullpath is the 3rd column
         fullpath = app_row.split(",")[2]
-        expected = str((root / "src" / "app.py"))
+        expected = str((csv_tree / "src" / "app.py"))
         assert fullpath == expected
 
-    def test_depth_column_for_root_level_file(self, tmp_path: Path) -> None:
-        root = _build_csv_tree(tmp_path)
-        entries = scan(root)
-        output = format_csv(entries, CsvOptions(root_path=root))
-        rows = output.splitlines()[1:]
-        readme_row = next(r for r in rows if "README.md" in r)
+    def test_depth_column_for_root_level_file(
+        self, csv_default_output: tuple[int, str, list[str]]
+    ) -> None:
+        _, _, lines = csv_default_output
+        readme_row = next(r for r in lines[1:] if "README.md" in r)
         depth = int(readme_row.split(",")[-1])
         assert depth == 0
 
-    def test_depth_column_for_nested_file(self, tmp_path: Path) -> None:
-        root = _build_csv_tree(tmp_path)
-        entries = scan(root)
-        output = format_csv(entries, CsvOptions(root_path=root))
-        rows = output.splitlines()[1:]
-        guide_row = next(r for r in rows if "guide.md" in r)
+    def test_depth_column_for_nested_file(
+        self, csv_default_output: tuple[int, str, list[str]]
+    ) -> None:
+        _, _, lines = csv_default_output
+        guide_row = next(r for r in lines[1:] if "guide.md" in r)
         depth = int(guide_row.split(",")[-1])
         assert depth == 1
 
 
 class TestFormatCsvFilesOnly:
-    def test_files_only_excludes_directory_rows(self, tmp_path: Path) -> None:
-        root = _build_csv_tree(tmp_path)
-        entries = scan(root)
-        output = format_csv(entries, CsvOptions(root_path=root, files_only=True))
-        rows = output.splitlines()[1:]
+    def test_files_only_excludes_directory_rows(
+        self, csv_files_only_output: list[str]
+    ) -> None:
         # All rows should be files (not directories)
         dir_names = {"docs", "src"}
-        for row in rows:
+        for row in csv_files_only_output:
             filename = row.split(",")[1]
             assert filename not in dir_names, f"Directory row leaked: {row!r}"
 
-    def test_files_only_keeps_all_file_rows(self, tmp_path: Path) -> None:
-        root = _build_csv_tree(tmp_path)
-        entries = scan(root)
-        output = format_csv(entries, CsvOptions(root_path=root, files_only=True))
-        rows = output.splitlines()[1:]
-        filenames = {r.split(",")[1] for r in rows}
+    def test_files_only_keeps_all_file_rows(
+        self, csv_files_only_output: list[str]
+    ) -> None:
+        filenames = {r.split(",")[1] for r in csv_files_only_output}
         assert "README.md" in filenames
         assert "guide.md" in filenames
         assert "app.py" in filenames
@@ -20,9 +20,12 @@ def _normalize_paths(output: str, root: Path) -> str:
     """Replace absolute root prefix in fullpath column with '<ROOT>'.
 
     This makes golden files portable across machines and OS path styles.
+    Replacement runs on UTF-8 bytes: bytes.replace scans raw memory
+    without str's per-character canonical-form handling, which matters
+    for the larger golden documents.
     """
-    root_str = str(root)
-    return output.replace(root_str, "<ROOT>")
+    root_bytes = str(root).encode("utf-8")
+    return output.encode("utf-8").replace(root_bytes, b"<ROOT>").decode("utf-8")
 
 
 class TestCsvGolden:
@@ -53,33 +53,33 @@ class TestShortGolden:
     @pytest.mark.parametrize(
         ("root_fixture_name", "cli_args", "golden_name"),
         [
-            ("sample_tree", ["--short"], "short_basic"),
+            ("sample_tree_ro", ["--short"], "short_basic"),
             (
-                "noisy_tree",
+                "noisy_tree_ro",
                 ["--short", "--preset", "node", "-a"],
                 "short_preset_node",
             ),
-            ("sample_tree", ["--short", "--budget", "50"], "short_budget_over"),
-            ("sample_tree", ["--short", "--count"], "short_count"),
-            ("sample_tree", ["--short", "-L", "1"], "short_depth1"),
-            ("sample_tree", ["--short", "-I", "tests"], "short_exclude_tests"),
+            ("sample_tree_ro", ["--short", "--budget", "50"], "short_budget_over"),
+            ("sample_tree_ro", ["--short", "--count"], "short_count"),
+            ("sample_tree_ro", ["--short", "-L", "1"], "short_depth1"),
+            ("sample_tree_ro", ["--short", "-I", "tests"], "short_exclude_tests"),
             (
-                "noisy_tree",
+                "noisy_tree_ro",
                 ["--short", "--preset", "python"],
                 "short_preset_python",
             ),
             (
-                "sample_tree",
+                "sample_tree_ro",
                 ["--short", "--budget", "100", "--count"],
                 "short_budget_count",
             ),
-            ("sample_tree", ["--short", "-I", "*.py"], "short_exclude_wildcard"),
+            ("sample_tree_ro", ["--short", "-I", "*.py"], "short_exclude_wildcard"),
             (
-                "sample_tree",
+                "sample_tree_ro",
                 ["--short", "-I", "tests", "-I", "docs"],
                 "short_exclude_multi",
             ),
-            ("sample_tree", ["--short", "-L", "2"], "short_depth2"),
+            ("sample_tree_ro", ["--short", "-L", "2"], "short_depth2"),
         ],
     )
     def test_short_golden_matrix(
@@ -93,10 +93,9 @@ class TestShortGolden:
         output = _run_cli_for_root(root, cli_args)
         assert_golden(output, golden_name)
 
-    def test_short_all_files(self, sample_tree: Path) -> None:
+    def test_short_all_files(self, sample_tree_with_env: Path) -> None:
         """--short + -a shows hidden files."""
-        (sample_tree / ".env").write_text("secret")
-        output = _run_cli_for_root(sample_tree, ["--short", "-a"])
+        output = _run_cli_for_root(sample_tree_with_env, ["--short", "-a"])
         assert_golden(output, "short_all_files")
 
 
@@ -138,9 +137,8 @@ class TestShortOptionBehavior:
         output = _run_cli_for_root(noisy_tree, ["--short", "--preset", "python"])
         assert "__pycache__" not in output
 
-    def test_short_all_shows_hidden(self, sample_tree: Path) -> None:
-        (sample_tree / ".env").write_text("s")
-        output = _run_cli_for_root(sample_tree, ["--short", "-a"])
+    def test_short_all_shows_hidden(self, sample_tree_with_env: Path) -> None:
+        output = _run_cli_for_root(sample_tree_with_env, ["--short", "-a"])
         assert ".env" in output
 
     def test_budget_with_count_no_crash(self, sample_tree: Path) -> None:
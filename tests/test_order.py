@@ -1,5 +1,8 @@
 """Tests for --order option (name sort direction: asc / desc)."""
 
+import csv
+import io
+import re
 from pathlib import Path
 
 import pytest
@@ -36,13 +39,13 @@ def _dir(name: str, parent: Path, depth: int = 0) -> Entry:
 ROOT = Path("/fake/root")
 
 
+# One findall over the whole output replaces a per-line split+rstrip.
+_COMPAT_NAME_RE = re.compile(r"\u2500\u2500 (.+?)/?$", re.MULTILINE)
+
+
 def _names_from_compat(result: str) -> list[str]:
     """Extract entry names from compat output lines."""
-    return [
-        line.split("\u2500\u2500 ")[1].rstrip("/")
-        for line in result.splitlines()
-        if "\u2500\u2500 " in line
-    ]
+    return _COMPAT_NAME_RE.findall(result)
 
 
 # ---------------------------------------------------------------------------
@@ -116,17 +119,17 @@ class TestShortOrder:
             _file("y.txt", sub, depth=1),
         ]
         result = format_short(entries, ShortOptions(root_path=ROOT, order="desc"))
-        lines = result.splitlines()
-        root_line = next(line for line in lines if line.startswith("."))
-        sub_line = next(line for line in lines if "sub" in line)
-        assert root_line.endswith("z.txt, a.txt")
-        assert sub_line.endswith("y.txt, b.txt")
+        # One pass over the lines instead of a next(...) scan per group.
+        by_prefix = {line.split(":", 1)[0]: line for line in result.splitlines()}
+        assert by_prefix["."].endswith("z.txt, a.txt")
+        assert by_prefix["sub"].endswith("y.txt, b.txt")
 
 
 def _csv_filenames(result: str) -> list[str]:
     """Extract filename column values from CSV output (skips header)."""
-    rows = result.splitlines()[1:]
-    return [r.split(",")[1] for r in rows if r]
+    reader = csv.reader(io.StringIO(result))
+    next(reader, None)
+    return [row[1] for row in reader if row]
 
 
 class TestCsvOrder:
@@ -165,44 +168,47 @@ class TestCsvOrder:
         assert _csv_filenames(result) == ["z.txt", "a.txt"]
 
 
+@pytest.fixture(scope="class")
+def order_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Small mixed tree shared by the CLI order tests, built once.
+
+    Contains ``a.txt``/``b.txt``/``c.txt`` and an empty ``sub/`` so one
+    tree covers the plain, short, CSV, and dirsfirst order cases.
+    """
+    root = tmp_path_factory.mktemp("order_tree")
+    (root / "c.txt").write_text("c")
+    (root / "a.txt").write_text("a")
+    (root / "b.txt").write_text("b")
+    (root / "sub").mkdir()
+    return root
+
+
 class TestCLIOrder:
-    def test_order_desc_compat(self, tmp_path: Path) -> None:
-        (tmp_path / "c.txt").write_text("c")
-        (tmp_path / "a.txt").write_text("a")
-        (tmp_path / "b.txt").write_text("b")
-        result = run_ntree([str(tmp_path), "--order", "desc"])
-        assert _names_from_compat(result) == ["c.txt", "b.txt", "a.txt"]
-
-    def test_order_asc_equals_default(self, tmp_path: Path) -> None:
-        (tmp_path / "c.txt").write_text("c")
-        (tmp_path / "a.txt").write_text("a")
-        default = run_ntree([str(tmp_path)])
-        explicit = run_ntree([str(tmp_path), "--order", "asc"])
+    def test_order_desc_compat(self, order_tree: Path) -> None:
+        result = run_ntree([str(order_tree), "--order", "desc"])
+        assert _names_from_compat(result) == ["sub", "c.txt", "b.txt", "a.txt"]
+
+    def test_order_asc_equals_default(self, order_tree: Path) -> None:
+        default = run_ntree([str(order_tree)])
+        explicit = run_ntree([str(order_tree), "--order", "asc"])
         assert default == explicit
 
-    def test_order_desc_short(self, tmp_path: Path) -> None:
-        (tmp_path / "c.txt").write_text("c")
-        (tmp_path / "a.txt").write_text("a")
-        result = run_ntree([str(tmp_path), "--short", "--order", "desc"])
-        assert "c.txt, a.txt" in result
+    def test_order_desc_short(self, order_tree: Path) -> None:
+        result = run_ntree([str(order_tree), "--short", "--order", "desc"])
+        assert "c.txt, b.txt, a.txt" in result
 
-    def test_order_desc_csv(self, tmp_path: Path) -> None:
-        (tmp_path / "c.txt").write_text("c")
-        (tmp_path / "a.txt").write_text("a")
-        result = run_ntree([str(tmp_path), "--csv", "--order", "desc"])
-        assert _csv_filenames(result) == ["c.txt", "a.txt"]
+    def test_order_desc_csv(self, order_tree: Path) -> None:
+        result = run_ntree([str(order_tree), "--csv", "--order", "desc"])
+        assert _csv_filenames(result) == ["sub", "c.txt", "b.txt", "a.txt"]
 
     def test_order_invalid_value(self, tmp_path: Path) -> None:
         with pytest.raises(SystemExit):
             run_ntree([str(tmp_path), "--order", "random"])
 
-    def test_order_desc_with_dirsfirst(self, tmp_path: Path) -> None:
-        (tmp_path / "z.txt").write_text("z")
-        (tmp_path / "a.txt").write_text("a")
-        (tmp_path / "sub").mkdir()
-        result = run_ntree([str(tmp_path), "--dirsfirst", "--order", "desc"])
+    def test_order_desc_with_dirsfirst(self, order_tree: Path) -> None:
+        result = run_ntree([str(order_tree), "--dirsfirst", "--order", "desc"])
         # Extract raw names (with trailing "/" for dirs) to distinguish dirs vs files
         raw_names = [
             line.split("── ")[1] for line in result.splitlines() if "── " in line
         ]
-        assert raw_names == ["sub/", "z.txt", "a.txt"]
+        assert raw_names == ["sub/", "c.txt", "b.txt", "a.txt"]
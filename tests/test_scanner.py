@@ -1,10 +1,12 @@
 """Tests for neotree.scanner."""
 
+import os
 from pathlib import Path
 
 import pytest
 
 from neotree.scanner import ScanOptions, scan
+from tests.conftest import NameFilter
 
 
 def _build_scanner_tree(tmp_path: Path) -> Path:
@@ -20,6 +22,12 @@ def _build_scanner_tree(tmp_path: Path) -> Path:
     return tmp_path
 
 
+@pytest.fixture(scope="session")
+def scanner_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-scoped scanner tree; tests only read it, never mutate."""
+    return _build_scanner_tree(tmp_path_factory.mktemp("scanner_tree"))
+
+
 def _scan_entry_names(root: Path, options: ScanOptions | None = None) -> list[str]:
     """Scan root and return entry names.
 
@@ -34,61 +42,56 @@ def _scan_entry_names(root: Path, options: ScanOptions | None = None) -> list[st
 
 
 class TestScanBasic:
-    def test_scans_all_non_hidden(self, tmp_path: Path) -> None:
-        root = _build_scanner_tree(tmp_path)
-        names = _scan_entry_names(root)
-        assert "alpha" in names
-        assert "beta" in names
-        assert "gamma.txt" in names
-        assert ".hidden" not in names  # hidden excluded by default
-
-    def test_includes_hidden_with_all_files(self, tmp_path: Path) -> None:
-        root = _build_scanner_tree(tmp_path)
-        names = _scan_entry_names(root, ScanOptions(all_files=True))
-        assert ".hidden" in names
-
-    def test_dirs_only(self, tmp_path: Path) -> None:
-        root = _build_scanner_tree(tmp_path)
-        entries = scan(root, ScanOptions(dirs_only=True))
-        assert all(e.is_dir for e in entries)
-        names = [e.name for e in entries]
-        assert "alpha" in names
-        assert "gamma.txt" not in names
-
     @pytest.mark.parametrize(
-        ("max_depth", "expected_present_names", "expected_absent_names"),
+        ("options", "expected_present_names", "expected_absent_names"),
         [
-            (0, ["alpha", "gamma.txt"], ["a1.txt"]),
-            (1, ["alpha", "a1.txt"], []),
+            # Default: non-hidden entries, hidden excluded
+            (None, ["alpha", "beta", "gamma.txt"], [".hidden"]),
+            # -a includes hidden entries
+            (ScanOptions(all_files=True), [".hidden"], []),
+            # -d drops files, keeps directories
+            (ScanOptions(dirs_only=True), ["alpha"], ["gamma.txt"]),
+            # Depth limits
+            (ScanOptions(max_depth=0), ["alpha", "gamma.txt"], ["a1.txt"]),
+            (ScanOptions(max_depth=1), ["alpha", "a1.txt"], []),
         ],
     )
-    def test_max_depth(
+    def test_option_matrix(
         self,
-        tmp_path: Path,
-        max_depth: int,
+        scanner_tree: Path,
+        options: ScanOptions | None,
         expected_present_names: list[str],
         expected_absent_names: list[str],
     ) -> None:
-        root = _build_scanner_tree(tmp_path)
-        names = _scan_entry_names(root, ScanOptions(max_depth=max_depth))
+        names = _scan_entry_names(scanner_tree, options)
         for name in expected_present_names:
             assert name in names
         for name in expected_absent_names:
             assert name not in names
 
-    def test_deterministic_order(self, tmp_path: Path) -> None:
-        root = _build_scanner_tree(tmp_path)
-        entries1 = scan(root)
-        entries2 = scan(root)
+    def test_dirs_only_returns_only_dirs(self, scanner_tree: Path) -> None:
+        entries = scan(scanner_tree, ScanOptions(dirs_only=True))
+        assert all(e.is_dir for e in entries)
+
+    def test_deterministic_order(self, scanner_tree: Path) -> None:
+        entries1 = scan(scanner_tree)
+        entries2 = scan(scanner_tree)
         assert [e.name for e in entries1] == [e.name for e in entries2]
 
-    def test_entry_fields(self, tmp_path: Path) -> None:
-        root = _build_scanner_tree(tmp_path)
-        entries = scan(root, ScanOptions(max_depth=0))
+    def test_entry_fields(self, scanner_tree: Path) -> None:
+        entries = scan(scanner_tree, ScanOptions(max_depth=0))
         alpha = next(e for e in entries if e.name == "alpha")
         assert alpha.is_dir is True
         assert alpha.depth == 0
-        assert alpha.parent_path == root.resolve()
+        assert alpha.parent_path == scanner_tree.resolve()
+
+    def test_limit_truncates_dfs_prefix(self, scanner_tree: Path) -> None:
+        full = scan(scanner_tree)
+        limited = scan(scanner_tree, ScanOptions(limit=3))
+        assert limited == full[:3]
+
+    def test_limit_larger_than_tree_returns_all(self, scanner_tree: Path) -> None:
+        assert scan(scanner_tree, ScanOptions(limit=1000)) == scan(scanner_tree)
 
     def test_empty_dir(self, tmp_path: Path) -> None:
         entries = scan(tmp_path)
@@ -100,77 +103,157 @@ class TestScanBasic:
 
 
 class TestScanWithFilter:
-    def test_custom_filter_excludes(self, tmp_path: Path) -> None:
-        root = _build_scanner_tree(tmp_path)
-
-        class ExcludeBeta:
-            def should_exclude(self, name: str, is_dir: bool) -> bool:
-                return name == "beta"
-
-        entries = scan(root, entry_filter=ExcludeBeta())
+    def test_custom_filter_excludes(self, scanner_tree: Path) -> None:
+        entries = scan(scanner_tree, entry_filter=NameFilter("beta"))
         names = [e.name for e in entries]
         assert "beta" not in names
         assert "alpha" in names
 
 
+def _build_wide_tree(tmp_path: Path) -> Path:
+    """Create a tree whose root fans out past _PARALLEL_THRESHOLD.
+
+    Six root subdirectories (the threshold is 4), each with a file and
+    a nested directory, so the parallel listing path runs and has real
+    reassembly work to do.
+    """
+    for i in range(6):
+        sub = tmp_path / f"dir{i}"
+        (sub / "nested").mkdir(parents=True)
+        (sub / f"file{i}.txt").write_bytes(b"x")
+        (sub / "nested" / "deep.txt").write_bytes(b"d")
+    (tmp_path / "root.txt").write_bytes(b"r")
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def wide_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-scoped wide tree; tests only read it, never mutate."""
+    return _build_wide_tree(tmp_path_factory.mktemp("wide_tree"))
+
+
+class TestScanParallel:
+    """The parallel listing path must be indistinguishable from serial."""
+
+    @pytest.mark.parametrize(
+        ("options", "entry_filter"),
+        [
+            (None, None),
+            (ScanOptions(max_depth=1), None),
+            (ScanOptions(files_only=True), None),
+            (None, NameFilter("nested")),
+        ],
+    )
+    def test_parallel_matches_serial(
+        self,
+        wide_tree: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        options: ScanOptions | None,
+        entry_filter: NameFilter | None,
+    ) -> None:
+        # Six root subdirectories exceed the threshold, so this takes
+        # the parallel path.
+        parallel = scan(wide_tree, options, entry_filter)
+        # Raise the threshold out of reach to force the serial walk as
+        # the reference.
+        monkeypatch.setattr("neotree.scanner._PARALLEL_THRESHOLD", 10**9)
+        serial = scan(wide_tree, options, entry_filter)
+        assert parallel == serial
+
+    def test_parallel_deterministic(self, wide_tree: Path) -> None:
+        assert scan(wide_tree) == scan(wide_tree)
+
+
+_GITIGNORE_TREE_FILES: dict[str, bytes] = {
+    ".gitignore": b"*.pyc\nnode_modules/\n",
+    "src/app.py": b"app",
+    "src/app.pyc": b"\x00",
+    "node_modules/pkg/index.js": b"js",
+    "README.md": b"readme",
+}
+
+
 def _build_gitignore_tree(tmp_path: Path) -> Path:
-    """Create a tree with a .gitignore file for testing."""
-    (tmp_path / ".gitignore").write_text("*.pyc\nnode_modules/\n")
-    (tmp_path / "src").mkdir()
-    (tmp_path / "src" / "app.py").write_text("app")
-    (tmp_path / "src" / "app.pyc").write_bytes(b"\x00")
-    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
-    (tmp_path / "node_modules" / "pkg" / "index.js").write_text("js")
-    (tmp_path / "README.md").write_text("readme")
+    """Create a tree with a .gitignore file for testing.
+
+    Driven by a relpath-to-content table: one loop creates parents on
+    demand and writes bytes directly, instead of hand-ordered
+    mkdir/write_text pairs.
+    """
+    for rel, content in _GITIGNORE_TREE_FILES.items():
+        target = tmp_path / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
     return tmp_path
 
 
+@pytest.fixture(scope="session")
+def gitignore_scan_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-scoped gitignore tree; tests only read it, never mutate."""
+    return _build_gitignore_tree(tmp_path_factory.mktemp("gitignore_scan_tree"))
+
+
 class TestScanWithGitignore:
-    def test_gitignore_excludes_matching_files(self, tmp_path: Path) -> None:
-        root = _build_gitignore_tree(tmp_path)
-        entries = scan(root, ScanOptions(gitignore=True))
+    def test_gitignore_excludes_matching_files(self, gitignore_scan_tree: Path) -> None:
+        entries = scan(gitignore_scan_tree, ScanOptions(gitignore=True))
         names = [e.name for e in entries]
         assert "app.pyc" not in names
         assert "app.py" in names
 
-    def test_gitignore_excludes_directory_and_contents(self, tmp_path: Path) -> None:
-        root = _build_gitignore_tree(tmp_path)
-        entries = scan(root, ScanOptions(gitignore=True))
+    def test_gitignore_excludes_directory_and_contents(
+        self, gitignore_scan_tree: Path
+    ) -> None:
+        entries = scan(gitignore_scan_tree, ScanOptions(gitignore=True))
         names = [e.name for e in entries]
         assert "node_modules" not in names
         assert "pkg" not in names
         assert "index.js" not in names
 
-    def test_gitignore_disabled_by_default(self, tmp_path: Path) -> None:
-        root = _build_gitignore_tree(tmp_path)
-        entries = scan(root, ScanOptions())
+    def test_gitignore_disabled_by_default(self, gitignore_scan_tree: Path) -> None:
+        entries = scan(gitignore_scan_tree, ScanOptions())
         names = [e.name for e in entries]
         assert "app.pyc" in names
         assert "node_modules" in names
 
-    def test_gitignore_no_gitignore_file_returns_all(self, tmp_path: Path) -> None:
-        root = _build_scanner_tree(tmp_path)
-        entries_without = scan(root)
-        entries_with = scan(root, ScanOptions(gitignore=True))
+    def test_gitignore_no_gitignore_file_returns_all(self, scanner_tree: Path) -> None:
+        entries_without = scan(scanner_tree)
+        entries_with = scan(scanner_tree, ScanOptions(gitignore=True))
         assert [e.name for e in entries_without] == [e.name for e in entries_with]
 
-    def test_gitignore_with_exclude_filter_both_applied(self, tmp_path: Path) -> None:
-        root = _build_gitignore_tree(tmp_path)
-
-        class ExcludeReadme:
-            def should_exclude(self, name: str, is_dir: bool) -> bool:
-                return name == "README.md"
-
-        entries = scan(root, ScanOptions(gitignore=True), entry_filter=ExcludeReadme())
+    def test_gitignore_with_exclude_filter_both_applied(
+        self, gitignore_scan_tree: Path
+    ) -> None:
+        entries = scan(
+            gitignore_scan_tree,
+            ScanOptions(gitignore=True),
+            entry_filter=NameFilter("README.md"),
+        )
         names = [e.name for e in entries]
         assert "README.md" not in names  # excluded by filter
         assert "app.pyc" not in names  # excluded by gitignore
         assert "node_modules" not in names  # excluded by gitignore
         assert "app.py" in names  # kept
 
-    def test_gitignore_preserves_non_ignored_entries(self, tmp_path: Path) -> None:
-        root = _build_gitignore_tree(tmp_path)
-        entries = scan(root, ScanOptions(gitignore=True))
+    def test_gitignore_does_not_descend_into_ignored_dir(
+        self, gitignore_scan_tree: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Pruning happens at descent: an ignored directory never reaches
+        # the stack, so its subtree is never listed at all.
+        scanned: list[str] = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path: Path) -> object:
+            scanned.append(str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr("neotree.scanner.os.scandir", counting_scandir)
+        scan(gitignore_scan_tree, ScanOptions(gitignore=True))
+        assert not any("node_modules" in path for path in scanned)
+
+    def test_gitignore_preserves_non_ignored_entries(
+        self, gitignore_scan_tree: Path
+    ) -> None:
+        entries = scan(gitignore_scan_tree, ScanOptions(gitignore=True))
         names = [e.name for e in entries]
         assert "src" in names
         assert "app.py" in names
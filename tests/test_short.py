@@ -2,48 +2,80 @@
 
 from pathlib import Path
 
+import pytest
+
 from neotree.formatter.short import ShortOptions, format_short
-from neotree.scanner import scan
+from neotree.scanner import Entry, scan
+
+# Relpath-to-content manifest for the shared short-formatter tree.
+_SHORT_TREE_FILES: dict[str, bytes] = {
+    "src/api/user.py": b"u",
+    "src/api/auth.py": b"a",
+    "src/api/routes.py": b"r",
+    "src/models/user.py": b"u",
+    "tests/test_user.py": b"t",
+    "README.md": b"readme",
+}
 
 
 def _build_short_tree(tmp_path: Path) -> Path:
-    (tmp_path / "src" / "api").mkdir(parents=True)
-    (tmp_path / "src" / "api" / "user.py").write_text("u")
-    (tmp_path / "src" / "api" / "auth.py").write_text("a")
-    (tmp_path / "src" / "api" / "routes.py").write_text("r")
-    (tmp_path / "src" / "models").mkdir()
-    (tmp_path / "src" / "models" / "user.py").write_text("u")
-    (tmp_path / "tests").mkdir()
-    (tmp_path / "tests" / "test_user.py").write_text("t")
-    (tmp_path / "README.md").write_text("readme")
+    """Materialize the manifest tree: one mkdir per distinct parent,
+    then byte writes (skipping write_text's encode step)."""
+    for parent in {Path(rel).parent for rel in _SHORT_TREE_FILES}:
+        (tmp_path / parent).mkdir(parents=True, exist_ok=True)
+    for rel, content in _SHORT_TREE_FILES.items():
+        (tmp_path / rel).write_bytes(content)
     return tmp_path
 
 
+@pytest.fixture(scope="session")
+def short_tree(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> tuple[Path, list[Entry]]:
+    """Session-scoped ``(resolved_root, entries)`` pair.
+
+    The tree build and scan — the expensive parts of these tests — run
+    once per session; each test only re-runs ``format_short``, the unit
+    actually under test. Tests must not mutate the tree or the list.
+    """
+    root = _build_short_tree(tmp_path_factory.mktemp("short_tree")).resolve()
+    return root, scan(root)
+
+
 def _render_short_output(
-    root: Path,
+    short_tree: tuple[Path, list[Entry]],
     budget: int | None = None,
     count: bool = False,
 ) -> str:
-    """Scan and render short output for a root path.
+    """Render short output from the shared scanned tree.
 
     Args:
-        root: Root directory.
+        short_tree: ``(resolved_root, entries)`` from the fixture.
         budget: Optional character budget.
         count: Whether to show file counts.
 
     Returns:
         str: Rendered short output.
     """
-    entries = scan(root)
+    root, entries = short_tree
     return format_short(
-        entries, ShortOptions(root_path=root.resolve(), budget=budget, count=count)
+        entries, ShortOptions(root_path=root, budget=budget, count=count)
     )
 
 
+@pytest.fixture(scope="session")
+def short_default_output(short_tree: tuple[Path, list[Entry]]) -> str:
+    """Default-options rendering of the shared tree, computed once.
+
+    Three tests assert against this exact output; memoizing it as a
+    fixture renders it a single time per session.
+    """
+    return _render_short_output(short_tree)
+
+
 class TestFormatShortBasic:
-    def test_basic_output(self, tmp_path: Path) -> None:
-        root = _build_short_tree(tmp_path)
-        output = _render_short_output(root)
+    def test_basic_output(self, short_default_output: str) -> None:
+        output = short_default_output
         # Should have no box-drawing characters
         for char in ("├", "└", "│"):
             assert char not in output
@@ -51,13 +83,12 @@ class TestFormatShortBasic:
         assert "user.py" in output
         assert "auth.py" in output
 
-    def test_comma_join(self, tmp_path: Path) -> None:
-        root = _build_short_tree(tmp_path)
-        output = _render_short_output(root)
-        # src/api should have files comma-joined
-        api_line = [line for line in output.split("\n") if "src/api" in line]
-        assert len(api_line) == 1
-        assert ", " in api_line[0]
+    def test_comma_join(self, short_default_output: str) -> None:
+        output = short_default_output
+        # src/api should have files comma-joined; unpacking the generator
+        # asserts exactly one matching line without building a list.
+        (api_line,) = (line for line in output.splitlines() if "src/api" in line)
+        assert ", " in api_line
 
     def test_childless_dir(self, tmp_path: Path) -> None:
         root = tmp_path
@@ -67,56 +98,61 @@ class TestFormatShortBasic:
         output = format_short(entries, ShortOptions(root_path=root.resolve()))
         assert "empty_dir/" in output
 
-    def test_count_flag(self, tmp_path: Path) -> None:
-        root = _build_short_tree(tmp_path)
-        output = _render_short_output(root, count=True)
+    def test_count_flag(self, short_tree: tuple[Path, list[Entry]]) -> None:
+        output = _render_short_output(short_tree, count=True)
         assert "(files: 3)" in output  # src/api has 3 files
 
     def test_empty_entries(self) -> None:
         output = format_short([])
         assert output == ""
 
-    def test_root_level_files(self, tmp_path: Path) -> None:
-        root = _build_short_tree(tmp_path)
-        output = _render_short_output(root)
-        # README.md at root level
-        root_line = [line for line in output.split("\n") if "README.md" in line]
-        assert len(root_line) == 1
+    def test_root_level_files(self, short_default_output: str) -> None:
+        output = short_default_output
+        # README.md appears on exactly one line; count via generator
+        # instead of materializing the matches.
+        assert sum(1 for line in output.splitlines() if "README.md" in line) == 1
 
 
 class TestFormatShortBudget:
-    def test_budget_aggregates_deep(self, tmp_path: Path) -> None:
-        root = _build_short_tree(tmp_path)
+    def test_budget_aggregates_deep(self, short_tree: tuple[Path, list[Entry]]) -> None:
         # Very small budget to force aggregation
-        output = _render_short_output(root, budget=50)
+        output = _render_short_output(short_tree, budget=50)
         # Deep dirs should be aggregated with explicit summary format
         assert "files)" in output
         # Aggregated lines must use the "dir/* (N files)" format
-        agg_lines = [line for line in output.split("\n") if "files)" in line]
+        agg_lines = [line for line in output.splitlines() if "files)" in line]
         for line in agg_lines:
             assert "/*" in line, f"Aggregated line missing '/*': {line!r}"
 
-    def test_budget_no_aggregation_when_fits(self, tmp_path: Path) -> None:
-        root = _build_short_tree(tmp_path)
+    def test_budget_no_aggregation_when_fits(
+        self, short_tree: tuple[Path, list[Entry]]
+    ) -> None:
         # Large budget — no aggregation needed
-        output = _render_short_output(root, budget=10000)
+        output = _render_short_output(short_tree, budget=10000)
         assert "files)" not in output
         assert "user.py" in output
 
-    def test_budget_only_aggregates_what_needed(self, tmp_path: Path) -> None:
+    def test_budget_only_aggregates_what_needed(
+        self, short_tree: tuple[Path, list[Entry]]
+    ) -> None:
         """Budget should aggregate just enough — not the whole tree."""
-        root = _build_short_tree(tmp_path)
         # Full output ≈ 89 chars. Budget=80 → only deepest group (src/api) aggregated.
-        output = _render_short_output(root, budget=80)
-        lines = output.split("\n")
+        output = _render_short_output(short_tree, budget=80)
+
+        # Classify lines in one pass instead of one scan per predicate.
+        api_lines: list[str] = []
+        tests_lines: list[str] = []
+        for line in output.splitlines():
+            if "src/api" in line:
+                api_lines.append(line)
+            if line.startswith("tests"):
+                tests_lines.append(line)
 
         # src/api (depth 2) should be aggregated
-        api_lines = [line for line in lines if "src/api" in line]
         assert len(api_lines) == 1
         assert "files)" in api_lines[0], "src/api should be aggregated"
 
         # tests (depth 1, shallower) should NOT be aggregated
-        tests_lines = [line for line in lines if line.startswith("tests")]
         assert len(tests_lines) == 1
         assert (
             "test_user.py" in tests_lines[0]
@@ -149,28 +185,32 @@ class TestFormatShortBudget:
         output = format_short(
             entries, ShortOptions(root_path=tmp_path.resolve(), budget=50)
         )
-        lines = output.split("\n")
+
+        # Classify lines in one pass instead of one scan per predicate.
+        agg_lines: list[str] = []
+        root_lines: list[str] = []
+        for line in output.splitlines():
+            if "files)" in line:
+                agg_lines.append(line)
+            if "root.txt" in line:
+                root_lines.append(line)
 
         # ALL aggregated lines must use "/* (N files)" — this is the regression
         # invariant for the mutation-while-iterating bug.
-        agg_lines = [line for line in lines if "files)" in line]
         assert len(agg_lines) >= 1, "Expected at least one aggregated line"
         for line in agg_lines:
             assert "/*" in line, f"Aggregated line lost summary format: {line!r}"
 
         # root.txt (depth 0) must NOT be aggregated at budget=50
-        root_lines = [line for line in lines if "root.txt" in line]
         assert len(root_lines) == 1, "root.txt should be visible (not aggregated)"
 
-    def test_budget_with_count(self, tmp_path: Path) -> None:
+    def test_budget_with_count(self, short_tree: tuple[Path, list[Entry]]) -> None:
         """--budget + --count must not crash and must still aggregate correctly."""
-        root = _build_short_tree(tmp_path)
-        output = _render_short_output(root, budget=80, count=True)
-        lines = output.split("\n")
+        output = _render_short_output(short_tree, budget=80, count=True)
         # Must produce some output
-        assert lines
+        assert output
 
         # Aggregated lines must use /* (N files) — not count's (files: N) format
-        agg_lines = [line for line in lines if "/*" in line]
+        agg_lines = [line for line in output.splitlines() if "/*" in line]
         for line in agg_lines:
             assert "files)" in line